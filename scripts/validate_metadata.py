@@ -6,17 +6,27 @@ Validates BIOBRICK.yaml metadata files against schema requirements,
 verifies asset file existence, and validates schemas for parquet and SQLite files.
 """
 
+import functools
 import json
+import os
 import re
 import sqlite3
 import sys
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import closing
 from pathlib import Path
 from typing import Optional
 
 import biobricks as bb
 import pyarrow.parquet as pq
 import yaml
-from jsonschema import SchemaError, ValidationError, validate
+from jsonschema import Draft202012Validator
+
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader
 
 
 class Colors:
@@ -32,14 +42,38 @@ class Colors:
     BOLD = "\033[1m"
     UNDERLINE = "\033[4m"
 
+    @classmethod
+    def disable(cls):
+        """Replace every color code with an empty string"""
+        for name, value in list(vars(cls).items()):
+            if not name.startswith("_") and isinstance(value, str):
+                setattr(cls, name, "")
+
+
+# Skip escape codes when they won't be rendered. GitHub Actions logs aren't a
+# TTY but do render colors, so keep them there. Runs before the report
+# prefixes below are built.
+if os.environ.get("NO_COLOR") or not (
+    sys.stdout.isatty()
+    or os.environ.get("FORCE_COLOR")
+    or os.environ.get("GITHUB_ACTIONS") == "true"
+):
+    Colors.disable()
+
 
 class ValidationReport:
     """Collects and formats validation results"""
 
+    # Message prefixes, rendered once rather than per message
+    _ERROR_PREFIX = f"{Colors.FAIL}✗ ERROR:{Colors.ENDC} "
+    _WARNING_PREFIX = f"{Colors.WARNING}⚠ WARNING:{Colors.ENDC} "
+    _SUCCESS_PREFIX = f"{Colors.OKGREEN}✓{Colors.ENDC} "
+
     def __init__(self):
-        self.errors = []
-        self.warnings = []
-        self.successes = []
+        # Raw messages; formatting is deferred until print_report
+        self.errors: list[tuple[str, Optional[str], Optional[str]]] = []
+        self.warnings: list[str] = []
+        self.successes: list[str] = []
         self.has_critical_errors = False
 
     def add_error(
@@ -47,58 +81,74 @@ class ValidationReport:
     ):
         """Add a validation error"""
         self.has_critical_errors = True
-        error_msg = f"{Colors.FAIL}✗ ERROR:{Colors.ENDC} {message}"
-        if expected and actual:
-            error_msg += f"\n  {Colors.BOLD}Expected:{Colors.ENDC} {expected}"
-            error_msg += f"\n  {Colors.BOLD}Actual:{Colors.ENDC} {actual}"
-        self.errors.append(error_msg)
+        self.errors.append((message, expected, actual))
 
     def add_warning(self, message: str):
         """Add a validation warning"""
-        self.warnings.append(f"{Colors.WARNING}⚠ WARNING:{Colors.ENDC} {message}")
+        self.warnings.append(message)
 
     def add_success(self, message: str):
         """Add a successful validation"""
-        self.successes.append(f"{Colors.OKGREEN}✓{Colors.ENDC} {message}")
+        self.successes.append(message)
+
+    def merge(self, other: "ValidationReport"):
+        """Append the results collected in another report"""
+        self.errors.extend(other.errors)
+        self.warnings.extend(other.warnings)
+        self.successes.extend(other.successes)
+        self.has_critical_errors |= other.has_critical_errors
+
+    def _format_error(
+        self, message: str, expected: Optional[str], actual: Optional[str]
+    ) -> str:
+        """Render an error with its optional expected/actual details"""
+        error_msg = f"{self._ERROR_PREFIX}{message}"
+        if expected and actual:
+            error_msg += f"\n  {Colors.BOLD}Expected:{Colors.ENDC} {expected}"
+            error_msg += f"\n  {Colors.BOLD}Actual:{Colors.ENDC} {actual}"
+        return error_msg
 
     def print_report(self):
         """Print the complete validation report"""
-        print("\n" + "=" * 80)
-        print(
-            f"{Colors.BOLD}{Colors.HEADER}BIOBRICK METADATA VALIDATION REPORT{Colors.ENDC}"
-        )
-        print("=" * 80 + "\n")
-
-        if self.successes:
-            print(f"{Colors.BOLD}Successful Checks:{Colors.ENDC}")
-            for success in self.successes:
-                print(f"  {success}")
-            print()
-
-        if self.warnings:
-            print(f"{Colors.BOLD}Warnings:{Colors.ENDC}")
-            for warning in self.warnings:
-                print(f"  {warning}")
-            print()
-
-        if self.errors:
-            print(f"{Colors.BOLD}Errors:{Colors.ENDC}")
-            for error in self.errors:
-                print(f"  {error}")
-            print()
-
-        print("=" * 80)
+        # Build the whole report and write it to stdout in one call
+        rule = "=" * 80 + "\n"
+        buf = [
+            "\n",
+            rule,
+            f"{Colors.BOLD}{Colors.HEADER}BIOBRICK METADATA VALIDATION REPORT{Colors.ENDC}\n",
+            rule,
+            "\n",
+        ]
+
+        for title, messages in (
+            (
+                "Successful Checks",
+                [f"{self._SUCCESS_PREFIX}{m}" for m in self.successes],
+            ),
+            ("Warnings", [f"{self._WARNING_PREFIX}{m}" for m in self.warnings]),
+            ("Errors", [self._format_error(*error) for error in self.errors]),
+        ):
+            if messages:
+                buf.append(f"{Colors.BOLD}{title}:{Colors.ENDC}\n")
+                buf.extend(f"  {message}\n" for message in messages)
+                buf.append("\n")
+
+        buf.append(rule)
         if self.has_critical_errors:
-            print(f"{Colors.FAIL}{Colors.BOLD}VALIDATION FAILED{Colors.ENDC}")
-            print(
-                f"{Colors.FAIL}Please fix the errors above and try again.{Colors.ENDC}"
+            buf.append(f"{Colors.FAIL}{Colors.BOLD}VALIDATION FAILED{Colors.ENDC}\n")
+            buf.append(
+                f"{Colors.FAIL}Please fix the errors above and try again.{Colors.ENDC}\n"
             )
         else:
-            print(f"{Colors.OKGREEN}{Colors.BOLD}VALIDATION PASSED{Colors.ENDC}")
-            print(
-                f"{Colors.OKGREEN}All metadata checks completed successfully!{Colors.ENDC}"
+            buf.append(f"{Colors.OKGREEN}{Colors.BOLD}VALIDATION PASSED{Colors.ENDC}\n")
+            buf.append(
+                f"{Colors.OKGREEN}All metadata checks completed successfully!{Colors.ENDC}\n"
             )
-        print("=" * 80 + "\n")
+        buf.append(rule)
+        buf.append("\n")
+
+        sys.stdout.write("".join(buf))
+        sys.stdout.flush()
 
 
 class MetadataValidator:
@@ -119,12 +169,53 @@ class MetadataValidator:
         },
     }
 
+    # Extensions whose files must all be listed as assets
+    COUNTED_EXTENSIONS = (".parquet", ".sqlite")
+
+    # Memory-map parquet files at least this large (bytes)
+    MMAP_THRESHOLD = 1024 * 1024
+    # Maximum bytes of a SQLite database to memory-map
+    SQLITE_MMAP_SIZE = 256 * 1024 * 1024
+
+    # Compatible type groups; a type belongs to every group whose names it contains
+    TYPE_MAPPINGS = {
+        "DOUBLE": ["DOUBLE", "FLOAT64", "FLOAT", "DECIMAL"],
+        "FLOAT": ["FLOAT", "DOUBLE", "FLOAT32", "FLOAT64"],
+        "INT": ["INT32", "INT64", "INT", "INTEGER", "LONG"],
+        "INT32": ["INT32", "INT", "INTEGER"],
+        "INT64": ["INT64", "LONG", "BIGINT"],
+        "VARCHAR": ["STRING", "VARCHAR", "TEXT", "UTF8"],
+        "STRING": ["STRING", "VARCHAR", "TEXT", "UTF8"],
+        "BYTE_ARRAY": ["BINARY", "BYTE_ARRAY", "VARBINARY", "BYTES"],
+        "BOOLEAN": ["BOOL", "BOOLEAN"],
+        "TIMESTAMP": [
+            "TIMESTAMP",
+            "DATETIME",
+            "TIMESTAMP_MILLIS",
+            "TIMESTAMP_MICROS",
+        ],
+    }
+
+    # Maximum number of JSON schema errors listed per asset
+    MAX_SCHEMA_ERRORS = 5
+
+    # Compile the parquet schema once instead of on every asset
+    Draft202012Validator.check_schema(PARQUET_SCHEMA_JSON)
+    PARQUET_VALIDATOR = Draft202012Validator(PARQUET_SCHEMA_JSON)
+
     def __init__(self, repo_path: str):
-        self.repo_path = Path(repo_path).resolve()
+        # absolute() makes no syscalls; no consumer needs symlinks resolved
+        self.repo_path = Path(repo_path).absolute()
         self.biobrick_path = self.repo_path / "BIOBRICK.yaml"
         self.brick_dir = self.repo_path / "brick"
         self.report = ValidationReport()
         self.metadata = None
+        # Relative path -> DirEntry for every file under brick/; built lazily
+        # by _get_brick_index so the brick checks don't depend on call order
+        self._brick_index: Optional[dict[str, os.DirEntry]] = None
+        # Asset path -> DirEntry (or Path, outside the index) for assets
+        # confirmed by _validate_asset_files; None until that check has run
+        self._existing_assets: Optional[dict[str, os.DirEntry | Path]] = None
 
     def validate(self) -> bool:
         """Run all validations and return True if successful"""
@@ -187,8 +278,8 @@ class MetadataValidator:
     def _load_yaml(self) -> bool:
         """Load and parse YAML file"""
         try:
-            with open(self.biobrick_path, "r") as f:
-                self.metadata = yaml.safe_load(f)
+            with open(self.biobrick_path, "rb") as f:
+                self.metadata = yaml.load(f, Loader=SafeLoader)
 
             if self.metadata is None:
                 self.report.add_error(
@@ -323,6 +414,30 @@ class MetadataValidator:
         self.report.add_success("Brick directory exists")
         return True
 
+    def _get_brick_index(self) -> dict[str, os.DirEntry]:
+        """Index every file under the brick directory by its relative path"""
+        if self._brick_index is None:
+            if self.brick_dir.is_dir():
+                self._brick_index = {
+                    os.path.relpath(entry.path, self.brick_dir): entry
+                    for entry in self._iter_brick_files()
+                }
+            else:
+                self._brick_index = {}
+        return self._brick_index
+
+    def _find_asset_file(self, asset_path: str) -> Optional[os.DirEntry | Path]:
+        """Return the DirEntry or Path of an asset's file, or None if it isn't one"""
+        entry = self._get_brick_index().get(os.path.normpath(asset_path))
+        if entry is not None:
+            return entry
+
+        # The index doesn't descend into symlinked directories, so check directly
+        full_path = self.brick_dir / asset_path
+        if full_path.is_file():
+            return full_path
+        return None
+
     def _validate_assets_structure(self) -> bool:
         """Validate structure of each asset entry"""
         all_valid = True
@@ -383,149 +498,174 @@ class MetadataValidator:
 
     def _validate_asset_files(self):
         """Verify that asset files exist at their specified paths"""
+        self._existing_assets = {}
         for asset_path in self.metadata["assets"].keys():
-            full_path = self.brick_dir / asset_path
+            asset_file = self._find_asset_file(asset_path)
+            if asset_file is not None:
+                self._existing_assets[asset_path] = asset_file
+                self.report.add_success(f"Asset file exists: {asset_path}")
+                continue
 
+            full_path = self.brick_dir / asset_path
             if not full_path.exists():
                 self.report.add_error(
                     f"Asset file not found: {asset_path}",
                     expected=f"File at {full_path}",
                     actual="File does not exist",
                 )
-            elif not full_path.is_file():
+            else:
                 self.report.add_error(
                     f"Asset path is not a file: {asset_path}",
                     expected="Regular file",
                     actual="Directory or other type",
                 )
-            else:
-                self.report.add_success(f"Asset file exists: {asset_path}")
+
+    def _iter_brick_files(self):
+        """Yield a DirEntry for every regular file under the brick directory"""
+        # os.scandir reuses the file type from readdir, avoiding a stat per entry
+        stack = [self.brick_dir]
+        while stack:
+            try:
+                entries = os.scandir(stack.pop())
+            except PermissionError:
+                # Skip unreadable directories, as Path.rglob does
+                continue
+            with entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    elif entry.is_file():
+                        yield entry
 
     def _validate_asset_counts(self):
         """Validate that the number of .parquet and .sqlite files matches assets in YAML"""
-        # Count files in brick directory
-        parquet_files = set()
-        sqlite_files = set()
-
-        for file_path in self.brick_dir.rglob("*"):
-            if file_path.is_file():
-                rel_path = file_path.relative_to(self.brick_dir)
-                if str(rel_path).endswith(".parquet"):
-                    parquet_files.add(str(rel_path))
-                elif str(rel_path).endswith(".sqlite"):
-                    sqlite_files.add(str(rel_path))
-
-        # Count assets in YAML
-        yaml_parquet = set()
-        yaml_sqlite = set()
+        # Bucket files in brick directory and assets in YAML by extension
+        brick_files = defaultdict(set)
+        for rel_path in self._get_brick_index():
+            brick_files[os.path.splitext(rel_path)[1]].add(rel_path)
 
+        yaml_files = defaultdict(set)
         for asset_path in self.metadata["assets"].keys():
-            if asset_path.endswith(".parquet"):
-                yaml_parquet.add(asset_path)
-            elif asset_path.endswith(".sqlite"):
-                yaml_sqlite.add(asset_path)
-
-        # Compare parquet files
-        if parquet_files != yaml_parquet:
-            missing_in_yaml = parquet_files - yaml_parquet
-            extra_in_yaml = yaml_parquet - parquet_files
-
-            if missing_in_yaml:
-                self.report.add_error(
-                    "Found .parquet files in brick directory not listed in YAML",
-                    expected="All parquet files listed in assets",
-                    actual=f"Missing from YAML: {', '.join(sorted(missing_in_yaml))}",
-                )
-
-            if extra_in_yaml:
-                self.report.add_error(
-                    "Found .parquet files listed in YAML but not in brick directory",
-                    expected="All YAML assets exist as files",
-                    actual=f"Not found in brick dir: {', '.join(sorted(extra_in_yaml))}",
-                )
-        else:
-            if parquet_files:
-                self.report.add_success(
-                    f"All {len(parquet_files)} .parquet file(s) accounted for"
-                )
-
-        # Compare sqlite files
-        if sqlite_files != yaml_sqlite:
-            missing_in_yaml = sqlite_files - yaml_sqlite
-            extra_in_yaml = yaml_sqlite - sqlite_files
-
-            if missing_in_yaml:
-                self.report.add_error(
-                    "Found .sqlite files in brick directory not listed in YAML",
-                    expected="All sqlite files listed in assets",
-                    actual=f"Missing from YAML: {', '.join(sorted(missing_in_yaml))}",
-                )
+            yaml_files[os.path.splitext(asset_path)[1]].add(asset_path)
+
+        for ext in self.COUNTED_EXTENSIONS:
+            actual_files = brick_files[ext]
+            listed_files = yaml_files[ext]
+
+            # Set equality is a single pass; differences are only computed
+            # (and only they are sorted) when the sets disagree
+            if actual_files != listed_files:
+                missing_in_yaml = actual_files - listed_files
+                extra_in_yaml = listed_files - actual_files
+
+                if missing_in_yaml:
+                    self.report.add_error(
+                        f"Found {ext} files in brick directory not listed in YAML",
+                        expected=f"All {ext[1:]} files listed in assets",
+                        actual=f"Missing from YAML: {', '.join(sorted(missing_in_yaml))}",
+                    )
 
-            if extra_in_yaml:
-                self.report.add_error(
-                    "Found .sqlite files listed in YAML but not in brick directory",
-                    expected="All YAML assets exist as files",
-                    actual=f"Not found in brick dir: {', '.join(sorted(extra_in_yaml))}",
-                )
-        else:
-            if sqlite_files:
-                self.report.add_success(
-                    f"All {len(sqlite_files)} .sqlite file(s) accounted for"
-                )
+                if extra_in_yaml:
+                    self.report.add_error(
+                        f"Found {ext} files listed in YAML but not in brick directory",
+                        expected="All YAML assets exist as files",
+                        actual=f"Not found in brick dir: {', '.join(sorted(extra_in_yaml))}",
+                    )
+            else:
+                if actual_files:
+                    self.report.add_success(
+                        f"All {len(actual_files)} {ext} file(s) accounted for"
+                    )
 
     def _validate_schemas(self):
         """Validate schemas for parquet and SQLite files"""
-        for asset_path, asset_data in self.metadata["assets"].items():
-            full_path = self.brick_dir / asset_path
+        schema_handlers = {
+            ".parquet": self._validate_parquet_schema,
+            ".sqlite": self._validate_sqlite_schema,
+        }
 
-            # Skip if file doesn't exist (already reported)
-            if not full_path.exists():
+        # Missing files are reported by _validate_asset_files; if it hasn't
+        # run, find the files here and skip the missing ones
+        existing_assets = self._existing_assets
+        if existing_assets is None:
+            existing_assets = {}
+            for asset_path in self.metadata["assets"].keys():
+                asset_file = self._find_asset_file(asset_path)
+                if asset_file is not None:
+                    existing_assets[asset_path] = asset_file
+
+        jobs = []
+        for asset_path, asset_file in existing_assets.items():
+            handler = schema_handlers.get(os.path.splitext(asset_path)[1])
+            if handler is None:
                 continue
+            schema_str = self.metadata["assets"][asset_path]["schema"]
+            jobs.append((handler, asset_path, schema_str, asset_file))
+
+        def run(job) -> ValidationReport:
+            # Each job gets its own report; ValidationReport is not thread-safe
+            handler, asset_path, schema_str, asset_file = job
+            report = ValidationReport()
+            handler(asset_path, schema_str, asset_file, report)
+            return report
+
+        # Schema checks are I/O bound, so overlap them when there are enough
+        if len(jobs) < 4:
+            reports = map(run, jobs)
+        else:
+            with ThreadPoolExecutor(max_workers=min(32, len(jobs))) as executor:
+                reports = list(executor.map(run, jobs))
 
-            if asset_path.endswith(".parquet"):
-                self._validate_parquet_schema(
-                    asset_path, asset_data["schema"], full_path
-                )
-            elif asset_path.endswith(".sqlite"):
-                self._validate_sqlite_schema(
-                    asset_path, asset_data["schema"], full_path
-                )
+        # Merge in asset order so the report is deterministic
+        for report in reports:
+            self.report.merge(report)
 
     def _validate_parquet_schema(
-        self, asset_path: str, schema_str: str, file_path: Path
+        self,
+        asset_path: str,
+        schema_str: str,
+        asset_file: os.DirEntry | Path,
+        report: ValidationReport,
     ):
         """Validate parquet file schema"""
         # Parse schema as JSON
         try:
-            schema_json = json.loads(schema_str)
+            schema_json = self._parse_schema_json(schema_str)
         except json.JSONDecodeError as e:
-            self.report.add_error(
+            report.add_error(
                 f"Asset '{asset_path}' schema is not valid JSON: {str(e)}",
                 expected="Valid JSON array",
                 actual=schema_str,
             )
             return
 
-        # Validate against JSON schema
-        try:
-            validate(instance=schema_json, schema=self.PARQUET_SCHEMA_JSON)
-        except ValidationError as e:
-            self.report.add_error(
+        # Validate against JSON schema, only collecting errors when invalid
+        if not self.PARQUET_VALIDATOR.is_valid(schema_json):
+            # Locate each error, drop repeats, and cap the list for the report
+            messages = list(
+                dict.fromkeys(
+                    f"{e.json_path}: {e.message}"
+                    for e in self.PARQUET_VALIDATOR.iter_errors(schema_json)
+                )
+            )
+            if len(messages) > self.MAX_SCHEMA_ERRORS:
+                hidden = len(messages) - self.MAX_SCHEMA_ERRORS
+                messages = messages[: self.MAX_SCHEMA_ERRORS]
+                messages.append(f"... and {hidden} more")
+            report.add_error(
                 f"Asset '{asset_path}' schema does not conform to parquet schema format",
                 expected="Array of objects with column_name, logical, and physical",
-                actual=f"Validation error: {e.message}",
-            )
-            return
-        except SchemaError as e:
-            self.report.add_error(
-                f"Internal schema validation error for '{asset_path}': {str(e)}"
+                actual=f"Validation error: {'; '.join(messages)}",
             )
             return
 
         # Read actual parquet file schema
         try:
-            parquet_file = pq.read_table(file_path)
-            actual_schema = parquet_file.schema
+            # DirEntry caches its stat, so each file is stat'ed at most once
+            actual_schema = pq.read_schema(
+                os.fspath(asset_file),
+                memory_map=asset_file.stat().st_size >= self.MMAP_THRESHOLD,
+            )
 
             # Build expected schema from JSON
             expected_columns = {
@@ -534,10 +674,7 @@ class MetadataValidator:
             }
 
             # Build actual schema mapping
-            actual_columns = {}
-            for i in range(len(actual_schema)):
-                field = actual_schema.field(i)
-                actual_columns[field.name] = str(field.type)
+            actual_columns = {field.name: str(field.type) for field in actual_schema}
 
             # Compare column names
             expected_names = set(expected_columns.keys())
@@ -553,7 +690,7 @@ class MetadataValidator:
                 if extra:
                     error_parts.append(f"Extra columns: {', '.join(sorted(extra))}")
 
-                self.report.add_error(
+                report.add_error(
                     f"Asset '{asset_path}' schema column mismatch",
                     expected=f"Columns: {', '.join(sorted(expected_names))}",
                     actual=f"Columns: {', '.join(sorted(actual_names))} | {' | '.join(error_parts)}",
@@ -574,127 +711,124 @@ class MetadataValidator:
                     )
 
             if type_mismatches:
-                self.report.add_warning(
+                report.add_warning(
                     f"Asset '{asset_path}' has potential type mismatches:\n    "
                     + "\n    ".join(type_mismatches)
                 )
             else:
-                self.report.add_success(
+                report.add_success(
                     f"Asset '{asset_path}' schema matches parquet file "
                     f"({len(expected_columns)} columns)"
                 )
 
         except Exception as e:
-            self.report.add_error(
+            report.add_error(
                 f"Failed to read parquet file '{asset_path}': {str(e)}",
                 expected="Readable parquet file",
                 actual=f"Error: {type(e).__name__}",
             )
 
     def _validate_sqlite_schema(
-        self, asset_path: str, schema_str: str, file_path: Path
+        self,
+        asset_path: str,
+        schema_str: str,
+        asset_file: os.DirEntry | Path,
+        report: ValidationReport,
     ):
         """Validate SQLite file schema"""
         try:
-            # Connect to SQLite database
-            conn = sqlite3.connect(file_path)
-            cursor = conn.cursor()
-
-            # Get actual schema
-            cursor.execute("SELECT sql FROM sqlite_master WHERE type='table';")
-            tables = cursor.fetchall()
+            # Open read-only so a bad path can never create an empty database
+            uri = f"{Path(asset_file).as_uri()}?mode=ro&immutable=1"
+            with closing(sqlite3.connect(uri, uri=True)) as conn:
+                conn.execute("PRAGMA query_only=1")
+                conn.execute(f"PRAGMA mmap_size={self.SQLITE_MMAP_SIZE}")
+
+                # Get actual schema
+                tables = conn.execute(
+                    "SELECT sql FROM sqlite_master"
+                    " WHERE type='table' AND sql IS NOT NULL"
+                ).fetchall()
 
             if not tables:
-                self.report.add_error(
+                report.add_error(
                     f"Asset '{asset_path}' SQLite database contains no tables",
                     expected="At least one table with schema",
                     actual="No tables found",
                 )
-                conn.close()
                 return
 
             # Combine all CREATE TABLE statements
-            actual_schema_parts = [table[0] for table in tables if table[0]]
+            actual_schema_parts = [table[0] for table in tables]
             actual_schema = ";\n".join(actual_schema_parts) + ";"
 
-            # Normalize schemas for comparison (remove extra whitespace)
+            # Normalize schemas for display (remove extra whitespace)
             def normalize_schema(s):
                 # Remove extra whitespace and normalize
                 lines = [line.strip() for line in s.strip().split("\n")]
                 return "\n".join(line for line in lines if line)
 
-            expected_normalized = normalize_schema(schema_str)
-            actual_normalized = normalize_schema(actual_schema)
-
-            # Compare schemas
-            if expected_normalized.replace(" ", "").replace(
-                "\n", ""
-            ) != actual_normalized.replace(" ", "").replace("\n", ""):
-                self.report.add_error(
+            # Compare schemas ignoring whitespace; only format them on mismatch
+            if self._canonical_sql(schema_str) != self._canonical_sql(actual_schema):
+                report.add_error(
                     f"Asset '{asset_path}' schema does not match SQLite database schema",
-                    expected=f"\n{expected_normalized}",
-                    actual=f"\n{actual_normalized}",
+                    expected=f"\n{normalize_schema(schema_str)}",
+                    actual=f"\n{normalize_schema(actual_schema)}",
                 )
             else:
-                self.report.add_success(
+                report.add_success(
                     f"Asset '{asset_path}' schema matches SQLite database"
                 )
 
-            conn.close()
-
         except sqlite3.Error as e:
-            self.report.add_error(
+            report.add_error(
                 f"Failed to read SQLite database '{asset_path}': {str(e)}",
                 expected="Valid SQLite database file",
                 actual=f"SQLite error: {type(e).__name__}",
             )
         except Exception as e:
-            self.report.add_error(
+            report.add_error(
                 f"Failed to validate SQLite schema for '{asset_path}': {str(e)}",
                 expected="Readable SQLite file",
                 actual=f"Error: {type(e).__name__}",
             )
 
+    @staticmethod
+    @functools.cache
+    def _parse_schema_json(schema_str: str):
+        """Parse a schema string once; assets often share the same schema"""
+        # Callers must treat the result as read-only since it is shared
+        return json.loads(schema_str)
+
+    @staticmethod
+    @functools.cache
+    def _canonical_sql(sql: str) -> str:
+        """Strip all whitespace from SQL so formatting doesn't affect comparison"""
+        return "".join(sql.split())
+
+    @staticmethod
+    @functools.cache
+    def _type_groups(type_name: str) -> frozenset[str]:
+        """Return the compatibility groups an upper-cased type name belongs to"""
+        return frozenset(
+            group
+            for group, compatible_types in MetadataValidator.TYPE_MAPPINGS.items()
+            if any(ct in type_name for ct in compatible_types)
+        )
+
     def _types_compatible(self, expected_logical: str, actual_type: str) -> bool:
         """Check if expected and actual types are compatible"""
         # Normalize types for comparison
         expected_upper = expected_logical.upper()
         actual_upper = actual_type.upper()
 
-        # Define compatible type mappings
-        type_mappings = {
-            "DOUBLE": ["DOUBLE", "FLOAT64", "FLOAT", "DECIMAL"],
-            "FLOAT": ["FLOAT", "DOUBLE", "FLOAT32", "FLOAT64"],
-            "INT": ["INT32", "INT64", "INT", "INTEGER", "LONG"],
-            "INT32": ["INT32", "INT", "INTEGER"],
-            "INT64": ["INT64", "LONG", "BIGINT"],
-            "VARCHAR": ["STRING", "VARCHAR", "TEXT", "UTF8"],
-            "STRING": ["STRING", "VARCHAR", "TEXT", "UTF8"],
-            "BYTE_ARRAY": ["BINARY", "BYTE_ARRAY", "VARBINARY", "BYTES"],
-            "BOOLEAN": ["BOOL", "BOOLEAN"],
-            "TIMESTAMP": [
-                "TIMESTAMP",
-                "DATETIME",
-                "TIMESTAMP_MILLIS",
-                "TIMESTAMP_MICROS",
-            ],
-        }
-
         # Check if types match directly
         if expected_upper == actual_upper:
             return True
 
         # Check if they're in the same compatibility group
-        for compatible_types in type_mappings.values():
-            if expected_upper in compatible_types or any(
-                ct in expected_upper for ct in compatible_types
-            ):
-                if actual_upper in compatible_types or any(
-                    ct in actual_upper for ct in compatible_types
-                ):
-                    return True
-
-        return False
+        return not self._type_groups(expected_upper).isdisjoint(
+            self._type_groups(actual_upper)
+        )
 
 
 def main():